@@ -114,12 +114,11 @@ class ElementWithVars(ElementBase, Generic[VarType], ABC):
         for name, state in self.states.items():
             next_state = next_states[name]
             self.next_states[name] = next_state
-            if (
-                hasattr(next_state, "shape")
-                and hasattr(state, "shape")
-                and next_state.shape != state.shape
-            ):
-                raise RuntimeError("Shapes of new and old states do not match.")
+            next_shape = getattr(next_state, "shape", None)
+            if next_shape is not None:
+                shape = getattr(state, "shape", None)
+                if shape is not None and next_shape != shape:
+                    raise RuntimeError("Shapes of new and old states do not match.")
 
     def __str__(self) -> str:
         return self.name
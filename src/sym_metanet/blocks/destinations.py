@@ -1,9 +1,7 @@
-from collections.abc import Collection
 from typing import TYPE_CHECKING, Optional
 
 from sym_metanet.blocks.base import ElementWithVars
 from sym_metanet.engines.core import EngineBase, get_current_engine
-from sym_metanet.util.funcs import first
 from sym_metanet.util.types import VarType
 
 if TYPE_CHECKING:
@@ -16,6 +14,25 @@ class Destination(ElementWithVars[VarType]):
     """Ideal congestion-free destination, representing a sink where cars can leave the
     highway with no congestion (i.e., no slowing down due to downstream density)."""
 
+    __slots__ = ("_entering_link_cache",)
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Instantiates the destination with the given `name` attribute.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the destination. If `None`, one is automatically created from a
+            counter of the class' instancies.
+        """
+        super().__init__(name)
+        self._entering_link_cache: dict[int, "Link[VarType]"] = {}
+
+    def clear_cache(self) -> None:
+        """Clears the cached entering links of this destination, which are cached only
+        while the network is being stepped (see `Network.step`)."""
+        self._entering_link_cache.clear()
+
     def init_vars(self, *_, **__) -> None:
         """Initializes no variable in the ideal destination."""
 
@@ -47,14 +64,22 @@ class Destination(ElementWithVars[VarType]):
 
     def _get_entering_link(self, net: "Network") -> "Link[VarType]":
         """Internal utility to fetch the link entering this destination (can only be
-        one)."""
-        links_up: Collection[tuple["Node", "Node", "Link[VarType]"]] = net.in_links(
-            net.destinations[self]  # type: ignore[index]
-        )
-        assert (
-            len(links_up) == 1
-        ), "Internal error. Only one link can enter a destination."
-        return first(links_up)[-1]
+        one). While the network is being stepped, the link is cached, so the graph
+        is traversed and the topology is checked only once (see also
+        `Network.is_valid`)."""
+        key = id(net)
+        link_up = self._entering_link_cache.get(key)
+        if link_up is None:
+            links_up: tuple[tuple["Node", "Node", "Link[VarType]"], ...] = tuple(
+                net.in_links(net.destinations[self])  # type: ignore[index]
+            )
+            assert (
+                len(links_up) == 1
+            ), "Internal error. Only one link can enter a destination."
+            link_up = links_up[0][2]
+            if net.is_stepping:
+                self._entering_link_cache[key] = link_up
+        return link_up
 
 
 class CongestedDestination(Destination[VarType]):
@@ -62,6 +87,7 @@ class CongestedDestination(Destination[VarType]):
     cars cannot exit freely the highway but must slow down and, possibly, create a
     congestion."""
 
+    __slots__ = ()
     _disturbances = {"d"}
 
     def init_vars(
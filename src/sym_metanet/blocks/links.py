@@ -1,10 +1,8 @@
-from collections.abc import Collection
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from sym_metanet.blocks.base import ElementWithVars
 from sym_metanet.blocks.origins import MeteredOnRamp
 from sym_metanet.engines.core import EngineBase, get_current_engine
-from sym_metanet.util.funcs import first
 from sym_metanet.util.types import VarType
 
 if TYPE_CHECKING:
@@ -23,7 +21,17 @@ class Link(ElementWithVars[VarType]):
         measures", Netherlands TRAIL Research School.
     """
 
-    __slots__ = ("N", "lam", "L", "rho_max", "rho_crit", "v_free", "a", "turnrate")
+    __slots__ = (
+        "N",
+        "lam",
+        "L",
+        "rho_max",
+        "rho_crit",
+        "v_free",
+        "a",
+        "turnrate",
+        "_flow_cache",
+    )
     _states = {"rho", "v"}
 
     def __init__(
@@ -79,6 +87,7 @@ class Link(ElementWithVars[VarType]):
         self.v_free = free_flow_velocity
         self.a = a
         self.turnrate = turnrate
+        self._flow_cache: dict[int, VarType] = {}
 
     def init_vars(
         self,
@@ -125,22 +134,41 @@ class Link(ElementWithVars[VarType]):
         if positive_init_speed:
             self.states["v"] = engine.max(0, self.states["v"])
 
-    def get_flow(self, engine: Optional[EngineBase] = None, **kwargs) -> VarType:
+    def clear_cache(self) -> None:
+        """Clears the cached flows of this link, which are cached only while the network
+        it belongs to is being stepped (see `Network.step`)."""
+        self._flow_cache.clear()
+
+    def get_flow(
+        self,
+        engine: Optional[EngineBase] = None,
+        net: Optional["Network"] = None,
+        **kwargs,
+    ) -> VarType:
         """Gets the flow in this link's segments.
 
         Parameters
         ----------
         engine : EngineBase, optional
             The engine to be used. If `None`, the current engine is used.
+        net : Network, optional
+            The network this link belongs to. If given and being stepped, the flow is
+            cached and reused for the rest of the step.
 
         Returns
         -------
         variable
             The flow in this link.
         """
-        if engine is None:
-            engine = get_current_engine()
-        return engine.links.get_flow(self.states["rho"], self.states["v"], self.lam)
+        key = id(net)
+        q = self._flow_cache.get(key)
+        if q is None:
+            if engine is None:
+                engine = get_current_engine()
+            q = engine.links.get_flow(self.states["rho"], self.states["v"], self.lam)
+            if net is not None and net.is_stepping:
+                self._flow_cache[key] = q
+        return q
 
     def step_dynamics(
         self,
@@ -193,15 +221,16 @@ class Link(ElementWithVars[VarType]):
         node_up, node_down = net.nodes_by_link[self]  # type: ignore[index]
         rho = self.states["rho"]
         v = self.states["v"]
-        q = self.get_flow(engine)
+        q = self.get_flow(engine, net)
 
         # get upstream flow and speed, and downstream density
         v0, q0 = node_up.get_upstream_speed_and_flow(net, self, engine, T=T)
         rhoN_1 = node_down.get_downstream_density(net, engine)
         if self.N > 1:
-            q_up = engine.vcat(q0, q[:-1])
-            v_up = engine.vcat(v0, v[:-1])
-            rho_down = engine.vcat(rho[1:], rhoN_1)
+            vcat = engine.vcat
+            q_up = vcat(q0, q[:-1])
+            v_up = vcat(v0, v[:-1])
+            rho_down = vcat(rho[1:], rhoN_1)
         else:
             q_up = q0
             v_up = v0
@@ -210,33 +239,30 @@ class Link(ElementWithVars[VarType]):
         # check for ramp merging in this link's upstream node with other
         # entering links.
         q_ramp = None
-        if (
-            delta is not None
-            and node_up in net.origins_by_node
-            and any(net.in_links(node_up))
-        ):
-            origin = net.origins_by_node[node_up]  # type: ignore[index]
-            if isinstance(origin, MeteredOnRamp):
+        if delta is not None:
+            origin = net.origins_by_node.get(node_up)
+            if isinstance(origin, MeteredOnRamp) and any(net.in_links(node_up)):
                 q_ramp = origin.get_flow(net, T, engine)
 
         # check for lane drops in the next link (only if one link downstream)
         lanes_drop = None
         if phi is not None:
-            links_down: Collection[
-                tuple["Node", "Node", "Link[VarType]"]
-            ] = net.out_links(node_down)
+            links_down: tuple[tuple["Node", "Node", "Link[VarType]"], ...] = tuple(
+                net.out_links(node_down)
+            )
             if len(links_down) == 1:
-                link_down = first(links_down)[-1]
+                link_down = links_down[0][2]
                 lanes_drop = self.lam - link_down.lam  # type: ignore[operator]
             if lanes_drop == 0:
                 lanes_drop = None
 
         # step densities
-        rho_next = engine.links.step_density(rho, q, q_up, self.lam, self.L, T)
+        links_engine = engine.links
+        rho_next = links_engine.step_density(rho, q, q_up, self.lam, self.L, T)
 
         # step speeds
         Veq = self._get_equilibrium_speed(engine, rho)
-        v_next = engine.links.step_speed(
+        v_next = links_engine.step_speed(
             v,
             v_up,
             rho,
@@ -359,7 +385,7 @@ class SimplifiedLinkWithVsl(LinkWithVsl[VarType]):
 
     See `LinkWithVsl` for the original version."""
 
-    __slots__ = ("vsl", "alpha", "V_eq_type")
+    __slots__ = ("V_eq_type",)
     _actions = {"V"}
 
     def __init__(
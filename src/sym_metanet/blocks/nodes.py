@@ -1,9 +1,8 @@
 from collections.abc import Collection
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from sym_metanet.blocks.base import ElementBase
 from sym_metanet.engines.core import EngineBase, get_current_engine
-from sym_metanet.util.funcs import first
 from sym_metanet.util.types import Variable, VarType
 
 if TYPE_CHECKING:
@@ -23,10 +22,35 @@ class Node(ElementBase):
         measures", Netherlands TRAIL Research School.
     """
 
+    __slots__ = ("_down_density_cache", "_up_sf_cache", "_up_quantities_cache")
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Instantiates the node with the given `name` attribute.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the node. If `None`, one is automatically created from a counter of
+            the class' instancies.
+        """
+        super().__init__(name)
+        self._down_density_cache: dict[int, Variable] = {}
+        self._up_sf_cache: dict[tuple[int, int], tuple[Variable, Variable]] = {}
+        self._up_quantities_cache: dict[int, tuple[Variable, Variable, Any, Any]] = {}
+
+    def clear_cache(self) -> None:
+        """Clears the cached (virtual) quantities computed by this node. These are
+        cached only while the network is being stepped, i.e., while the variables of
+        the network's elements do not change (see `Network.step`)."""
+        self._down_density_cache.clear()
+        self._up_sf_cache.clear()
+        self._up_quantities_cache.clear()
+
     def get_downstream_density(
         self, net: "Network", engine: Optional[EngineBase] = None, **kwargs
     ) -> Variable:
-        """Computes the (virtual) downstream density of the node.
+        """Computes the (virtual) downstream density of the node. While the network is
+        being stepped, the result is cached and reused.
 
         Parameters
         ----------
@@ -40,26 +64,15 @@ class Node(ElementBase):
         symbolic variable
             Returns the (virtual) downstream density.
         """
-        if engine is None:
-            engine = get_current_engine()
-
-        # following the link entering this node, this node can only be a
-        # destination or have multiple exiting links
-        if self in net.destinations_by_node:
-            return net.destinations_by_node[self].get_density(
-                net, engine=engine, **kwargs
-            )
-
-        # if no destination, then there must be 1 or more exiting links
-        links_down: Collection[tuple["Node", "Node", "Link[Variable]"]] = net.out_links(
-            self
-        )
-        if len(links_down) == 1:
-            return first(links_down)[-1].states["rho"][0]
-        rho_firsts = engine.vcat(
-            *(dlink.states["rho"][0] for _, _, dlink in links_down)
-        )
-        return engine.nodes.get_downstream_density(rho_firsts)
+        key = id(net)
+        rho = self._down_density_cache.get(key)
+        if rho is None:
+            if engine is None:
+                engine = get_current_engine()
+            rho = self._compute_downstream_density(net, engine, **kwargs)
+            if net.is_stepping:
+                self._down_density_cache[key] = rho
+        return rho
 
     def get_upstream_speed_and_flow(
         self,
@@ -69,7 +82,8 @@ class Node(ElementBase):
         **kwargs,
     ) -> tuple[VarType, VarType]:
         """Computes the (virtual) upstream speed and flow of the node for the current
-        link.
+        link. While the network is being stepped, the result is cached per link and
+        reused.
 
         Parameters
         ----------
@@ -86,47 +100,98 @@ class Node(ElementBase):
         tuple[symbolic variable, symbolic variable]
             Returns the (virtual) upstream speed and flow.
         """
+        key = (id(net), id(link))
+        cached = self._up_sf_cache.get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
         if engine is None:
             engine = get_current_engine()
 
+        # speed and flows are shared among all the exiting links, and only the split of
+        # the flow (in case of multiple entering links) depends on the given link
+        v, q, betas, q_o = self._get_upstream_quantities(net, engine, **kwargs)
+        if betas is not None:
+            q = engine.nodes.get_upstream_flow(q, link.turnrate, betas, q_o)
+        if net.is_stepping:
+            self._up_sf_cache[key] = v, q
+        return v, q  # type: ignore[return-value]
+
+    def _compute_downstream_density(
+        self, net: "Network", engine: EngineBase, **kwargs
+    ) -> Variable:
+        """Internal utility to compute the (virtual) downstream density of the node."""
+        # following the link entering this node, this node can only be a
+        # destination or have multiple exiting links
+        destination = net.destinations_by_node.get(self)
+        if destination is not None:
+            return destination.get_density(net, engine=engine, **kwargs)
+
+        # if no destination, then there must be 1 or more exiting links
+        links_down: tuple[tuple["Node", "Node", "Link[Variable]"], ...] = tuple(
+            net.out_links(self)
+        )
+        if len(links_down) == 1:
+            return links_down[0][2].states["rho"][0]
+        rho_firsts = [dlink.states["rho"][0] for _, _, dlink in links_down]
+        return engine.nodes.get_downstream_density(engine.vcat(*rho_firsts))
+
+    def _get_upstream_quantities(
+        self, net: "Network", engine: EngineBase, **kwargs
+    ) -> tuple[VarType, VarType, Any, Any]:
+        """Internal utility to compute the upstream quantities of the node that are
+        shared among all its exiting links, i.e., the upstream speed, the flow (or the
+        flows of the entering links, if multiple), and, if multiple entering links are
+        present, the turnrates of the exiting links and the flow of the origin. These
+        are cached while the network is being stepped."""
+        key = id(net)
+        cached = self._up_quantities_cache.get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+
         # the node can have 1 or more entering links, as well as a ramp origin.
         # Speed is dictated by the entering links, if any; otherwise by the
         # origin (same as first segment). Flow is dictated both by entering
         # links and origin.
-        links_up: Collection[tuple["Node", "Node", "Link[VarType]"]] = net.in_links(
-            self
+        links_up: tuple[tuple["Node", "Node", "Link[VarType]"], ...] = tuple(
+            net.in_links(self)
         )
         n_up = len(links_up)
-        if self in net.origins_by_node:
-            origin = net.origins_by_node[self]  # type: ignore[index]
-            v_o = origin.get_speed(net, engine=engine, **kwargs)
+        origin = net.origins_by_node.get(self)
+        if origin is not None:
             q_o = origin.get_flow(net, engine=engine, **kwargs)
         else:
-            v_o = None
             q_o = None
 
+        betas = None
         if n_up == 0:
-            v = v_o
+            # the origin's speed is needed only when no link enters the node
+            v = None
+            if origin is not None:
+                v = origin.get_speed(net, engine=engine, **kwargs)
             q = q_o
         elif n_up == 1:
-            link_up = next(iter(links_up))[-1]
+            _, _, link_up = links_up[0]
             v = link_up.states["v"][-1]
-            q = link_up.get_flow(engine)[-1]
+            q = link_up.get_flow(engine, net)[-1]
             if q_o is not None:
                 q += q_o  # type: ignore[assignment,operator]
         else:
-            v_last = []
-            q_last = []
+            # gather speeds and flows of the entering links in a single sweep, and
+            # concatenate each of them only once
+            v_lasts = []
+            q_lasts = []
             for _, _, link_up in links_up:
-                v_last.append(link_up.states["v"][-1])
-                q_last.append(link_up.get_flow(engine)[-1])
-            v_last = engine.vcat(*v_last)
-            q_last = engine.vcat(*q_last)
+                v_lasts.append(link_up.states["v"][-1])
+                q_lasts.append(link_up.get_flow(engine, net)[-1])
+            vcat = engine.vcat
+            q = vcat(*q_lasts)
+            v = engine.nodes.get_upstream_speed(q, vcat(*v_lasts))
             links_down: Collection[
                 tuple["Node", "Node", "Link[VarType]"]
             ] = net.out_links(self)
-            betas = engine.vcat(*(dlink.turnrate for _, _, dlink in links_down))
+            betas = vcat(*[dlink.turnrate for _, _, dlink in links_down])
 
-            v = engine.nodes.get_upstream_speed(q_last, v_last)
-            q = engine.nodes.get_upstream_flow(q_last, link.turnrate, betas, q_o)
-        return v, q  # type: ignore[return-value]
+        quantities = (v, q, betas, q_o)
+        if net.is_stepping:
+            self._up_quantities_cache[key] = quantities  # type: ignore[assignment]
+        return quantities  # type: ignore[return-value]
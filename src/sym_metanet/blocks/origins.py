@@ -1,9 +1,7 @@
-from collections.abc import Collection
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from sym_metanet.blocks.base import ElementWithVars
 from sym_metanet.engines.core import EngineBase, get_current_engine
-from sym_metanet.util.funcs import first
 from sym_metanet.util.types import VarType
 
 if TYPE_CHECKING:
@@ -16,6 +14,27 @@ class Origin(ElementWithVars[VarType]):
     """Ideal, state-less highway origin that conveys to the attached link as much flow
     as the flow in such link."""
 
+    __slots__ = ("_exiting_link_cache", "_flow_cache")
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Instantiates the origin with the given `name` attribute.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the origin. If `None`, one is automatically created from a counter
+            of the class' instancies.
+        """
+        super().__init__(name)
+        self._exiting_link_cache: dict[int, "Link[VarType]"] = {}
+        self._flow_cache: dict[int, VarType] = {}
+
+    def clear_cache(self) -> None:
+        """Clears the cached exiting links and flows of this origin, which are cached
+        only while the network is being stepped (see `Network.step`)."""
+        self._exiting_link_cache.clear()
+        self._flow_cache.clear()
+
     def init_vars(self, *_, **__) -> None:
         """Initializes no variable in the ideal origin."""
 
@@ -55,18 +74,53 @@ class Origin(ElementWithVars[VarType]):
         symbolic variable
             The origin's upstream flow.
         """
-        return self._get_exiting_link(net).get_flow(engine)[0]
+        return self._get_cached_flow(net, None, engine)
+
+    def _get_cached_flow(
+        self,
+        net: "Network",
+        T: Union[VarType, float, None],
+        engine: Optional[EngineBase],
+    ) -> VarType:
+        """Internal utility to compute the flow of this origin via `_compute_flow`.
+        While the network is being stepped, the flow is cached, as the same flow is
+        queried by the origin, its node and the link it is attached to."""
+        key = id(net)
+        q = self._flow_cache.get(key)
+        if q is None:
+            if engine is None:
+                engine = get_current_engine()
+            q = self._compute_flow(net, T, engine)
+            if net.is_stepping:
+                self._flow_cache[key] = q
+        return q
+
+    def _compute_flow(
+        self, net: "Network", T: Union[VarType, float, None], engine: EngineBase
+    ) -> VarType:
+        """Internal utility to compute the flow of the ideal origin, i.e., the flow of
+        the first segment of the attached link. Subclasses override this to change the
+        flow law."""
+        return self._get_exiting_link(net).get_flow(engine, net)[0]
 
     def _get_exiting_link(self, net: "Network") -> "Link[VarType]":
         """Internal utility to fetch the link leaving this destination (can only be
-        one)."""
-        links_down: Collection[tuple["Node", "Node", "Link[VarType]"]] = net.out_links(
-            net.origins[self]  # type: ignore[index]
-        )
-        assert (
-            len(links_down) == 1
-        ), "Internal error. Only one link can leave an origin."
-        return first(links_down)[-1]
+        one). While the network is being stepped, the link is cached, so the graph
+        is traversed and the topology is checked only once (see also
+        `Network.is_valid`)."""
+        key = id(net)
+        link_down = self._exiting_link_cache.get(key)
+        if link_down is None:
+            links_down: tuple[tuple["Node", "Node", "Link[VarType]"], ...] = tuple(
+                net.out_links(net.origins[self])  # type: ignore[index]
+            )
+            assert (
+                len(links_down) == 1
+            ), "Internal error. Only one link can leave an origin."
+            link_down = links_down[0][2]
+            if net.is_stepping:
+                self._exiting_link_cache[key] = link_down
+        return link_down
 
 
 class MainstreamOrigin(Origin[VarType]):
@@ -80,6 +134,7 @@ class MainstreamOrigin(Origin[VarType]):
         measures", Netherlands TRAIL Research School.
     """
 
+    __slots__ = ()
     _states = {"w"}
     _actions = {"r"}
     _disturbances = {"d"}
@@ -197,8 +252,12 @@ class MainstreamOrigin(Origin[VarType]):
         variable
             The origin's upstream flow.
         """
-        if engine is None:
-            engine = get_current_engine()
+        return self._get_cached_flow(net, T, engine)
+
+    def _compute_flow(  # type: ignore[override]
+        self, net: "Network", T: Union[VarType, float], engine: EngineBase
+    ) -> VarType:
+        """Internal utility to compute the flow of the mainstream origin."""
         link_down = self._get_exiting_link(net)
         return engine.origins.get_mainstream_flow(
             self.disturbances["d"],
@@ -363,8 +422,12 @@ class MeteredOnRamp(Origin[VarType]):
         variable
             The origin's upstream flow.
         """
-        if engine is None:
-            engine = get_current_engine()
+        return self._get_cached_flow(net, T, engine)
+
+    def _compute_flow(  # type: ignore[override]
+        self, net: "Network", T: Union[VarType, float], engine: EngineBase
+    ) -> VarType:
+        """Internal utility to compute the flow of the metered ramp."""
         link_down = self._get_exiting_link(net)
         return engine.origins.get_ramp_flow(
             self.disturbances["d"],
@@ -386,6 +449,7 @@ class SimplifiedMeteredOnRamp(MeteredOnRamp[VarType]):
 
     See `MeteredOnRamp` for the original version."""
 
+    __slots__ = ()
     _actions = {"q"}
 
     def __init__(
@@ -440,13 +504,26 @@ class SimplifiedMeteredOnRamp(MeteredOnRamp[VarType]):
     ) -> VarType:
         """Computes the (upstream) flow induced by the simple-metered ramp.
 
+        Parameters
+        ----------
+        net : Network
+            The network this destination belongs to.
+        T : variable or float
+            Sampling time of the simulation.
+        engine : EngineBase, optional
+            The engine to be used. If `None`, the current engine is used.
+
         Returns
         -------
         variable
             The origin's upstream flow.
         """
-        if engine is None:
-            engine = get_current_engine()
+        return self._get_cached_flow(net, T, engine)
+
+    def _compute_flow(  # type: ignore[override]
+        self, net: "Network", T: Union[VarType, float], engine: EngineBase
+    ) -> VarType:
+        """Internal utility to compute the flow of the simple-metered ramp."""
         link_down = self._get_exiting_link(net)
         return engine.origins.get_simplifiedramp_flow(
             self.actions["q"],
@@ -243,6 +243,7 @@ class Engine(EngineBase, Generic[VarType]):
         compact: int = 0,
         more_out: bool = False,
         parameters: Optional[dict[str, VarType]] = None,
+        options: Optional[dict[str, Any]] = None,
         **other_parameters: Any,
     ) -> cs.Function:
         """Converts the network's dynamics to a CasADi Function.
@@ -266,6 +267,11 @@ class Engine(EngineBase, Generic[VarType]):
             Includes flows of links and origins in the output. By default `False`.
         parameters : dict[str, casadi.SX or MX], optional
             Symbolic network parameters to be included in the function, by default None.
+        options : dict, optional
+            Additional options for the `casadi.Function` constructor, which override the
+            default ones, i.e., `{"allow_duplicate_io_names": True, "cse": True}`. For
+            example, `{"jit": True, "compiler": "shell"}` compiles the function to
+            native code, which speeds up repeated numerical evaluations.
         **other_parameters
             Other parameters (numerical or symbolical) required during the computations,
             e.g., sampling time T is usually required.
@@ -318,14 +324,10 @@ class Engine(EngineBase, Generic[VarType]):
             )
 
         # create dynamics function
-        return cs.Function(
-            "F",
-            args_in,
-            args_out,
-            names_in,
-            names_out,
-            {"allow_duplicate_io_names": True, "cse": True},
-        )
+        opts = {"allow_duplicate_io_names": True, "cse": True}
+        if options is not None:
+            opts.update(options)
+        return cs.Function("F", args_in, args_out, names_in, names_out, opts)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(casadi)"
@@ -1,8 +1,14 @@
 from collections.abc import Sequence
+from functools import cache
 from typing import Callable, Literal, Optional, Union
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from sym_metanet.engines.core import (
     DestinationsEngineBase,
     EngineBase,
@@ -195,6 +201,52 @@ class DestinationsEngine(DestinationsEngineBase):
         return np.maximum(np.minimum(rho_last, rho_crit), rho_destination)
 
 
+def _upstream_flow(q_lasts, beta, betas, q_orig):
+    """Internal kernel of `NodesEngine.get_upstream_flow` to be jit-compiled. Numba
+    cannot add an optional origin flow to the total flow, so the origin flow is always
+    required (zero, if there is none)."""
+    return (beta / np.sum(betas, 0)) * (np.sum(q_lasts, 0) + q_orig)
+
+
+@cache
+def _get_jit_engines() -> tuple[type[NodesEngine], type[DestinationsEngine]]:
+    """Internal utility to create (only once) the nodes and destinations engines whose
+    numerical kernels are jit-compiled with Numba."""
+    if njit is None:
+        raise ImportError("Numba is required to jit-compile the NumPy engine.")
+    jit = njit(cache=True)
+    jit_upstream_flow = jit(_upstream_flow)
+
+    class JitNodesEngine(NodesEngine):
+        """Same as `NodesEngine`, but jit-compiled with Numba."""
+
+        @staticmethod
+        def get_upstream_flow(
+            q_lasts: np.ndarray,
+            beta: np.ndarray,
+            betas: np.ndarray,
+            q_orig: Optional[np.ndarray] = None,
+        ) -> np.ndarray:
+            if q_orig is None:
+                q_orig = 0.0  # type: ignore[assignment]
+            return jit_upstream_flow(q_lasts, beta, betas, q_orig)
+
+        get_upstream_speed = staticmethod(jit(NodesEngine.get_upstream_speed))
+        get_downstream_density = staticmethod(jit(NodesEngine.get_downstream_density))
+
+    class JitDestinationsEngine(DestinationsEngine):
+        """Same as `DestinationsEngine`, but jit-compiled with Numba."""
+
+        get_congestion_free_downstream_density = staticmethod(
+            jit(DestinationsEngine.get_congestion_free_downstream_density)
+        )
+        get_congested_downstream_density = staticmethod(
+            jit(DestinationsEngine.get_congested_downstream_density)
+        )
+
+    return JitNodesEngine, JitDestinationsEngine
+
+
 class Engine(EngineBase):
     """Symbolic engine implemented with NumPy."""
 
@@ -209,6 +261,7 @@ class Engine(EngineBase):
             np.random.BitGenerator,
             np.random.Generator,
         ] = None,
+        jit: bool = False,
     ) -> None:
         """Instantiates a NumPy engine.
 
@@ -228,15 +281,26 @@ class Engine(EngineBase):
         seed : None, int, array_like[ints], SeedSequence, BitGenerator, Generator
             Seed for the random number generator (this is used in case `var_type` is
             either ``'rand'`` or ``'randn'``).
+        jit : bool, optional
+            If `True`, the numerical kernels of nodes and destinations are jit-compiled
+            with Numba. This speeds up each call to these kernels, but they take only a
+            small share of a network step, so whole simulations are not necessarily
+            faster. By default, `False`.
 
         Raises
         ------
         ValueError
             Raises if the specified type of variable initialization is invalid.
+        ImportError
+            Raises if `jit=True` but Numba is not installed.
         """
         super().__init__()
         self.var_type = var_type
         self.np_random = np.random.default_rng(seed)
+        if jit:
+            self._nodes, self._destinations = _get_jit_engines()
+        else:
+            self._nodes, self._destinations = NodesEngine, DestinationsEngine
 
     @property
     def var_type(self) -> Union[str, np.ndarray]:
@@ -282,7 +346,7 @@ class Engine(EngineBase):
 
     @property
     def nodes(self) -> type[NodesEngine]:
-        return NodesEngine
+        return self._nodes
 
     @property
     def links(self) -> type[LinksEngine]:
@@ -294,7 +358,7 @@ class Engine(EngineBase):
 
     @property
     def destinations(self) -> type[DestinationsEngine]:
-        return DestinationsEngine
+        return self._destinations
 
     def var(self, name: str, n: int = 1, *args, **kwargs) -> np.ndarray:
         return self._var_gen(n)
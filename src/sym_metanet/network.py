@@ -10,7 +10,7 @@ from sym_metanet.blocks.destinations import Destination
 from sym_metanet.blocks.links import Link
 from sym_metanet.blocks.nodes import Node
 from sym_metanet.blocks.origins import MeteredOnRamp, Origin
-from sym_metanet.engines.core import EngineBase
+from sym_metanet.engines.core import EngineBase, get_current_engine
 from sym_metanet.errors import InvalidNetworkError
 from sym_metanet.util.funcs import invalidate_cache
 from sym_metanet.util.types import VarType
@@ -36,6 +36,7 @@ class Network(ElementBase):
         """
         super().__init__(name)
         self._graph = nx.DiGraph(name=name)
+        self._is_stepping = False
 
     @property
     def G(self) -> nx.DiGraph:
@@ -125,6 +126,12 @@ class Network(ElementBase):
         d = self.destinations
         return dict(zip(d.values(), d.keys()))
 
+    @property
+    def is_stepping(self) -> bool:
+        """Gets whether the network's dynamics are being stepped. Only then nodes and
+        elements cache the quantities they compute (see `Network.step`)."""
+        return self._is_stepping
+
     @property
     def elements(self) -> Iterable[ElementWithVars[VarType]]:
         """Gets an iterator to all the elements of the network."""
@@ -543,31 +550,55 @@ class Network(ElementBase):
             All the other parameters (e.g., sampling time) required during
             the computations.
         """
-        # initialization
-        if init_conditions is None:
-            init_conditions = {}
-        for el in self.elements:
-            el.init_vars(
-                init_conditions=init_conditions.get(el),  # type: ignore[arg-type]
-                engine=engine,
-                positive_init_queue=positive_init_queue,
-                positive_init_density=positive_init_density,
-                positive_init_speed=positive_init_speed,
-            )
+        # nodes and elements cache quantities only while the network is being stepped,
+        # as only then the variables they are computed from are known not to change
+        self._clear_caches()
+        self._is_stepping = True
+        try:
+            # resolve the engine once, so that elements need not look it up again
+            if engine is None:
+                engine = get_current_engine()
+
+            # initialization
+            if init_conditions is None:
+                init_conditions = {}
+            for el in self.elements:
+                el.init_vars(
+                    init_conditions=init_conditions.get(el),  # type: ignore[arg-type]
+                    engine=engine,
+                    positive_init_queue=positive_init_queue,
+                    positive_init_density=positive_init_density,
+                    positive_init_speed=positive_init_speed,
+                )
 
-        # dynamics
-        for origin in self.origins:
-            origin.step(
-                net=self,
-                engine=engine,
-                positive_next_queue=positive_next_queue,
-                **other_parameters,
-            )
+            # dynamics
+            for origin in self.origins:
+                origin.step(
+                    net=self,
+                    engine=engine,
+                    positive_next_queue=positive_next_queue,
+                    **other_parameters,
+                )
+            for _, _, link in self.links:  # type: ignore[var-annotated]
+                link.step(
+                    net=self,
+                    engine=engine,
+                    positive_next_speed=positive_next_speed,
+                    positive_next_density=positive_next_density,
+                    **other_parameters,
+                )
+        finally:
+            self._is_stepping = False
+            self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """Internal utility to clear the caches of the network's nodes and elements that
+        are populated while stepping the dynamics."""
+        for node in self._graph.nodes:
+            node.clear_cache()
         for _, _, link in self.links:  # type: ignore[var-annotated]
-            link.step(
-                net=self,
-                engine=engine,
-                positive_next_speed=positive_next_speed,
-                positive_next_density=positive_next_density,
-                **other_parameters,
-            )
+            link.clear_cache()
+        for origin in self.origins:
+            origin.clear_cache()
+        for destination in self.destinations:
+            destination.clear_cache()
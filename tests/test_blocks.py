@@ -7,6 +7,8 @@ from sym_metanet import (
     Destination,
     Link,
     MeteredOnRamp,
+    Network,
+    Node,
     Origin,
     SimplifiedMeteredOnRamp,
     engines,
@@ -40,6 +42,37 @@ class TestLinks(unittest.TestCase):
             self.assertEqual(L.states[n].shape, (nb_seg,))
             np.testing.assert_equal(init_conds[n], L.states[n])
 
+    def test_get_flow__after_states_or_lanes_change__is_updated(self):
+        L = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        rho, v = np.full(4, 10.0), np.full(4, 50.0)
+        L.init_vars({"rho": rho, "v": v})
+        np.testing.assert_allclose(L.get_flow(), 1500)
+        rho[:] = 20.0
+        np.testing.assert_allclose(L.get_flow(), 3000)
+        L.lam = 1
+        np.testing.assert_allclose(L.get_flow(), 1000)
+        L.init_vars()
+        np.testing.assert_allclose(
+            L.get_flow(), L.states["rho"] * L.states["v"] * L.lam
+        )
+
+
+class TestNodes(unittest.TestCase):
+    def test_get_upstream_and_downstream_quantities__after_reinit__are_updated(self):
+        N1, N2, N3 = Node(name="N1"), Node(name="N2"), Node(name="N3")
+        L1 = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        L2 = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        net = Network().add_path(path=(N1, L1, N2, L2, N3))
+        for _ in range(2):
+            for link in (L1, L2):
+                link.init_vars()
+            v, q = N2.get_upstream_speed_and_flow(net, L2)
+            np.testing.assert_allclose(v, L1.states["v"][-1])
+            np.testing.assert_allclose(q, L1.get_flow()[-1])
+            np.testing.assert_allclose(
+                N2.get_downstream_density(net), L2.states["rho"][0]
+            )
+
 
 class TestDestinations(unittest.TestCase):
     def test_init_vars__no_value_is_initialized(self):
@@ -49,6 +82,38 @@ class TestDestinations(unittest.TestCase):
         self.assertIs(D.actions, None)
         self.assertIs(D.disturbances, None)
 
+    def test_get_density__after_topology_change__is_updated(self):
+        N1, N2 = Node(name="N1"), Node(name="N2")
+        L1 = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        L2 = Link[np.ndarray](4, 3, 1, 180, 20, 100, 1.8)
+        D = Destination()
+        net = Network().add_path(path=(N1, L1, N2), destination=D)
+        for link in (L1, L2):
+            link.init_vars()
+        np.testing.assert_allclose(
+            D.get_density(net), np.minimum(L1.states["rho"][-1], L1.rho_crit)
+        )
+        net.add_link(N1, L2, N2)
+        np.testing.assert_allclose(
+            D.get_density(net), np.minimum(L2.states["rho"][-1], L2.rho_crit)
+        )
+
+    def test_get_density__in_multiple_networks(self):
+        L1 = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        L2 = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        D = Destination()
+        nets = [
+            Network().add_path(
+                path=(Node(name="A1"), L, Node(name="B1")), destination=D
+            )
+            for L in (L1, L2)
+        ]
+        for L, net in zip((L1, L2), nets):
+            L.init_vars()
+            np.testing.assert_allclose(
+                D.get_density(net), np.minimum(L.states["rho"][-1], L.rho_crit)
+            )
+
 
 class TestCongestedDestinations(unittest.TestCase):
     def test_init_vars__without_inital_condition__creates_vars(self):
@@ -109,6 +174,17 @@ class TestMeteredOnRamp(unittest.TestCase):
             self.assertIn(d[n].shape, {(1,), ()})
             np.testing.assert_equal(init_conds[n], d[n])
 
+    def test_get_flow__after_reinit_or_with_other_T__is_updated(self):
+        N1, N2 = Node(name="N1"), Node(name="N2")
+        L = Link[np.ndarray](4, 3, 1, 180, 30, 100, 1.8)
+        R = MeteredOnRamp[np.ndarray](1e9)
+        net = Network().add_path(path=(N1, L, N2), origin=R)
+        L.init_vars({"rho": np.zeros(4), "v": np.ones(4)})
+        for w in (1.0, 1e6):
+            R.init_vars({"w": np.asarray([w]), "r": np.ones(1), "d": np.zeros(1)})
+            for T in (0.1, 10.0):
+                np.testing.assert_allclose(R.get_flow(net, T=T), w / T)
+
 
 class TestSimpleMeteredOnRamp(unittest.TestCase):
     def test_init_vars__without_inital_condition__creates_vars(self):
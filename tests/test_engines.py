@@ -1,4 +1,5 @@
 import unittest
+from importlib.util import find_spec
 from typing import Literal, Union
 
 import casadi as cs
@@ -9,6 +10,7 @@ import sym_metanet as metanet
 from sym_metanet import (
     CongestedDestination,
     Link,
+    MainstreamOrigin,
     MeteredOnRamp,
     Network,
     Node,
@@ -193,6 +195,18 @@ class TestCasadiEngine(unittest.TestCase):
         self.assertFalse(F.get_free())
         self.assertEqual(len(F(30, 80, 5, 1, 250, 500, 1)), 5)
 
+    def test_to_function__passes_options_to_casadi(self):
+        net, sym_pars, other_pars = get_net(self.sym_type)
+        engine = engines.use("casadi", sym_type=self.sym_type)
+        net.step(engine=engine, **other_pars)
+        kwargs = {"net": net, "parameters": sym_pars, "compact": 2, **other_pars}
+        F = engine.to_function(**kwargs)
+        F_no_cse = engine.to_function(**kwargs, options={"cse": False})
+        args = ([30, 30, 30, 80, 80, 80, 5, 5], [1, 250], [500, 400, 20], [33, 2, 100])
+        np.testing.assert_allclose(F(*args), F_no_cse(*args))
+        with self.assertRaises(RuntimeError):
+            engine.to_function(**kwargs, options={"not_an_option": 1})
+
     @parameterized.expand([(1,), (2,)])
     def test_to_function__numerically_works(self, link_with_ramp: int):
         net, sym_pars, other_pars = get_net(self.sym_type, link_with_ramp)
@@ -267,6 +281,11 @@ class TestCasadiVsNumpyEngine(unittest.TestCase):
             self.NE.nodes.get_upstream_flow(*args),
             self.CE.nodes.get_upstream_flow(*map(cs.DM, args)).full().squeeze(),
         )
+        args = [cs.DM(a) for a in args[:3]]
+        np.testing.assert_allclose(
+            self.NE.nodes.get_upstream_flow(q_lasts, betas[0], betas, None),
+            self.CE.nodes.get_upstream_flow(*args, None).full().squeeze(),
+        )
 
     def test_nodes__get_upstream_speed(self):
         N = self.N
@@ -406,5 +425,81 @@ class TestCasadiVsNumpyEngine(unittest.TestCase):
         )
 
 
+@unittest.skipIf(find_spec("numba") is None, "Numba is not installed.")
+class TestNumpyJitEngine(unittest.TestCase):
+    N = 7
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.NE = NumpyEngine()
+        cls.JE = NumpyEngine(jit=True)
+
+    def test_nodes__get_upstream_flow(self):
+        N = self.N
+        q_lasts = np.maximum(0, np.random.randn(N) * 50 + 200)
+        betas = np.random.rand(N) + 0.5
+        q_orig = np.maximum(0, np.random.randn(1) * 50 + 200)
+        for args in ([q_lasts, betas[0], betas], [q_lasts, betas[0], betas, q_orig]):
+            np.testing.assert_allclose(
+                self.NE.nodes.get_upstream_flow(*args),
+                self.JE.nodes.get_upstream_flow(*args),
+            )
+
+    def test_nodes__get_upstream_speed_and_downstream_density(self):
+        N = self.N
+        q_lasts = np.maximum(0, np.random.randn(N) * 50 + 200)
+        v_lasts = np.maximum(0, np.random.randn(N) * 10 + 60)
+        np.testing.assert_allclose(
+            self.NE.nodes.get_upstream_speed(q_lasts, v_lasts),
+            self.JE.nodes.get_upstream_speed(q_lasts, v_lasts),
+        )
+        np.testing.assert_allclose(
+            self.NE.nodes.get_downstream_density(v_lasts),
+            self.JE.nodes.get_downstream_density(v_lasts),
+        )
+
+    def test_destinations__get_downstream_density(self):
+        rho_last = np.random.rand(1) * 20 + 20
+        rho_destination = np.random.rand(1) * 30 + 20
+        rho_crit = np.random.rand() * 20 + 20
+        np.testing.assert_allclose(
+            self.NE.destinations.get_congestion_free_downstream_density(
+                rho_last, rho_crit
+            ),
+            self.JE.destinations.get_congestion_free_downstream_density(
+                rho_last, rho_crit
+            ),
+        )
+        args = [rho_last, rho_destination, rho_crit]
+        np.testing.assert_allclose(
+            self.NE.destinations.get_congested_downstream_density(*args),
+            self.JE.destinations.get_congested_downstream_density(*args),
+        )
+
+    def test_network_step__equals_non_jit_step(self):
+        N = [Node(name=f"N{i}") for i in range(7)]
+        L = [Link(2, 2, 1, 180, 33.5, 102, 1.8) for _ in range(6)]
+        net = (
+            Network()
+            .add_path(path=(N[0], L[0], N[1], L[1], N[2]), origin=MainstreamOrigin())
+            .add_path(path=(N[1], L[2], N[3], L[3], N[4], L[4], N[5]))
+            .add_path(path=(N[2], L[5], N[4]))
+            .add_destination(CongestedDestination(), N[5])
+        )
+        next_states = []
+        for jit in (False, True):
+            net.step(
+                engine=NumpyEngine(var_type="rand", seed=42, jit=jit),
+                T=10 / 3600,
+                tau=18 / 3600,
+                eta=60,
+                kappa=40,
+            )
+            next_states.append(net.next_states)
+        for el, states in next_states[0].items():
+            for n, state in states.items():
+                np.testing.assert_array_equal(state, next_states[1][el][n])
+
+
 if __name__ == "__main__":
     unittest.main()
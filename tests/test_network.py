@@ -2,7 +2,16 @@ import re
 import unittest
 from collections.abc import Iterable
 
-from sym_metanet import Destination, Link, MeteredOnRamp, Network, Node, Origin, engines
+from sym_metanet import (
+    Destination,
+    Link,
+    MainstreamOrigin,
+    MeteredOnRamp,
+    Network,
+    Node,
+    Origin,
+    engines,
+)
 
 engine = engines.use("numpy", var_type="randn")
 
@@ -286,6 +295,30 @@ class TestNetwork(unittest.TestCase):
             msgs,
         )
 
+    def test_is_stepping__is_true_only_while_stepping(self):
+        flags = []
+
+        class RecordingDestination(Destination):
+            def get_density(self, net, **kwargs):
+                flags.append(net.is_stepping)
+                return super().get_density(net, **kwargs)
+
+        N1, N2 = Node(name="N1"), Node(name="N2")
+        L = Link(4, 3, 1, 180, 30, 100, 1.8)
+        net = Network().add_path(
+            path=(N1, L, N2),
+            origin=MainstreamOrigin(),
+            destination=RecordingDestination(),
+        )
+        self.assertFalse(net.is_stepping)
+        net.step(T=10 / 3600, tau=18 / 3600, eta=60, kappa=40)
+        self.assertFalse(net.is_stepping)
+        self.assertTrue(flags)
+        self.assertTrue(all(flags))
+        with self.assertRaises(TypeError):
+            net.step()
+        self.assertFalse(net.is_stepping)
+
 
 if __name__ == "__main__":
     unittest.main()